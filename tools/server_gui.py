@@ -23,25 +23,467 @@ Usage:
     python3 server_gui.py [server_directory]
 """
 
-import tkinter as tk
-from tkinter import ttk, messagebox, filedialog, scrolledtext
 import os
 import sys
-import subprocess
 import threading
-import json
 import time
-import glob
-from datetime import datetime
 from pathlib import Path
-import tempfile
 import shutil
 import re
 import socket
 import struct
+import queue
+import codecs
+import logging
+import logging.handlers
+import concurrent.futures
+import mmap
+from array import array
+from collections import deque
+from contextlib import contextmanager
+
+logger = logging.getLogger('server_gui')
+
+# tkinter is imported by _import_tkinter() so headless runs never load Tcl/Tk
+tk = ttk = messagebox = filedialog = scrolledtext = None
+
+# Buffer size for user-space file copies
+COPY_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Number of files read ahead while writing a world backup
+ZIP_READAHEAD_FILES = 16
+
+# Number of archive members extracted at the same time when restoring a backup
+EXTRACT_WORKERS = 4
+
+# World files that are already compressed (region chunks, gzipped NBT), stored in backups as is
+_STORED_SUFFIXES = frozenset(('.mca', '.mcc', '.dat', '.dat_old', '.png', '.gz', '.zip', '.jar'))
+
+# bytes.isascii() is only available on Python 3.7+
+_isascii = getattr(bytes, 'isascii', lambda data: False)
+
+# Status label colour and text for each server state
+_STATE_TABLE = {
+    "running": ("green", "Status: Running"),
+    "starting": ("orange", "Status: Starting"),
+    "stopped": ("red", "Status: Stopped"),
+}
+
+# key=value line of server.properties / .env, comment lines excluded
+_CONFIG_LINE_RE = re.compile(r'^[ \t]*([^#=\s][^=\n]*)=(.*)$', re.M)
+
+# Log viewer highlighting; each group name is also the Text tag it applies
+_LOG_HIGHLIGHT_RE = re.compile(r'(?P<error>\bERROR\b)|(?P<warn>\bWARN\b)|(?P<timestamp>\[\d{2}:\d{2}:\d{2}\])')
+
+# Backup file name written by backup_world: <world>-<YYYYmmdd>-<HHMMSS>.zip
+_BACKUP_NAME_RE = re.compile(r'^(?P<world>.+)-\d{8}-\d{6}\.zip$')
+
+# Server log line printed once the server has finished starting
+_READY_RE = re.compile(r'\]: Done \([\d.,]+s\)! For help, type')
+
+# Server log lines that change the player count: `list` output, joins and leaves.
+# Anchored to the server thread's own log prefix (Forge adds a logger tag) so chat cannot fake them
+_SERVER_LINE_PREFIX = r'^\[[^\]\n]*\] \[Server thread/INFO\](?: \[[^\]\n]*\])?: '
+_PLAYER_EVENT_RE = re.compile(_SERVER_LINE_PREFIX + r'There are (?P<online>\d+) of a max of (?P<max>\d+) players'
+                              r'|' + _SERVER_LINE_PREFIX + r'(?P<joined>\w+) joined the game$'
+                              r'|' + _SERVER_LINE_PREFIX + r'(?P<left>\w+) left the game$', re.M)
+
+
+def _to_bool(value):
+    """Interpret a config file value as a boolean"""
+    return value.lower() == 'true'
+
+
+def _import_tkinter():
+    """Import tkinter and its submodules into the module namespace"""
+    global tk, ttk, messagebox, filedialog, scrolledtext
+    if tk is None:
+        import tkinter
+        from tkinter import ttk, messagebox, filedialog, scrolledtext
+        tk = tkinter
+
+
+def _script_command(script):
+    """Command line running a shell script; executable scripts with a usable shebang are
+    exec'd directly, saving the intermediate bash process"""
+    if os.name == 'posix' and os.access(script, os.X_OK):
+        with open(script, 'rb') as f:
+            first_line = f.readline()
+        # A CRLF shebang would make the kernel look for an interpreter named "bash\r"
+        if first_line.startswith(b'#!') and not first_line.endswith(b'\r\n'):
+            return [str(script)]
+    return ["bash", str(script)]
+
+
+def _fast_copy(src, dst):
+    """Copy a file and its metadata like shutil.copy2, using zero-copy sendfile() where supported"""
+    # Opening dst for writing would truncate src if both are the same file
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        copied = False
+        if hasattr(os, 'sendfile'):
+            try:
+                size = os.fstat(fsrc.fileno()).st_size
+                offset = 0
+                while offset < size:
+                    sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+                copied = True
+            except OSError:
+                # sendfile() not usable for these files, start over with a buffered copy
+                fsrc.seek(0)
+                fdst.seek(0)
+                fdst.truncate()
+        
+        if not copied:
+            shutil.copyfileobj(fsrc, fdst, COPY_BUFFER_SIZE)
+    shutil.copystat(src, dst)
+
+
+def _prefetched(paths, depth):
+    """Yield (path, fd) for each path, with the OS already reading the next depth files;
+    the caller closes each fd with _close_sequential"""
+    window = deque()
+    try:
+        for path in paths:
+            fd = _open_sequential(path)
+            window.append((path, fd))
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            if len(window) > depth:
+                yield window.popleft()
+        while window:
+            yield window.popleft()
+    finally:
+        # Left open if the consumer stopped early
+        for path, fd in window:
+            os.close(fd)
+
+
+def _file_digest(path):
+    """BLAKE2b digest of a file's contents"""
+    import hashlib
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(COPY_BUFFER_SIZE), b''):
+            digest.update(block)
+    return digest.digest()
+
+
+def _zip_tree(zip_path, root_dir, base_dir):
+    """Archive root_dir/base_dir into zip_path like shutil.make_archive, without recompressing compressed files"""
+    import zipfile
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, allowZip64=True) as zf:
+        for dirpath, dirnames, filenames in os.walk(os.path.join(root_dir, base_dir)):
+            arcdir = os.path.relpath(dirpath, root_dir)
+            zf.write(dirpath, arcdir)
+            paths = [os.path.join(dirpath, name) for name in filenames]
+            for path, fd in _prefetched(paths, ZIP_READAHEAD_FILES):
+                try:
+                    name = os.path.basename(path)
+                    zinfo = zipfile.ZipInfo.from_file(path, os.path.join(arcdir, name))
+                    if os.path.splitext(name)[1] in _STORED_SUFFIXES:
+                        zinfo.compress_type = zipfile.ZIP_STORED
+                    else:
+                        zinfo.compress_type = zipfile.ZIP_DEFLATED
+                    with os.fdopen(fd, 'rb', closefd=False) as src, zf.open(zinfo, 'w') as dst:
+                        shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+                finally:
+                    _close_sequential(fd)
+
+
+def _extract_zip(zip_path, dest_dir, progress=None):
+    """Extract a zip archive into dest_dir with large buffered copies, several members at a time;
+    progress(done_bytes, total_bytes) is called as members finish"""
+    import zipfile
+    dest_dir = os.path.realpath(dest_dir)
+    with zipfile.ZipFile(zip_path) as zf:
+        files = []
+        for info in zf.infolist():
+            target = os.path.realpath(os.path.join(dest_dir, info.filename))
+            # Refuse members that would land outside dest_dir (../ or absolute names)
+            if os.path.commonpath([dest_dir, target]) != dest_dir:
+                raise ValueError(f"Unsafe path in archive: {info.filename}")
+            if info.is_dir():
+                os.makedirs(target, exist_ok=True)
+            else:
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                files.append((info, target))
+        
+        def extract(member):
+            info, target = member
+            with zf.open(info) as src, open(target, 'wb') as dst:
+                shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+            return info.file_size
+        
+        total = sum(info.file_size for info, target in files) or 1
+        done = 0
+        # Members decompress independently; ZipFile serialises the reads of the archive itself
+        with concurrent.futures.ThreadPoolExecutor(max_workers=EXTRACT_WORKERS) as pool:
+            for size in pool.map(extract, files):
+                done += size
+                if progress is not None:
+                    progress(done, total)
+
+
+def _decode_log_bytes(decoder, data):
+    """Decode a log chunk, bypassing the UTF-8 codec for pure ASCII data"""
+    # No partial multi-byte sequence may be pending from the previous chunk
+    if _isascii(data) and not decoder.getstate()[0]:
+        return data.decode('ascii')
+    return decoder.decode(data)
+
+
+def _open_sequential(path):
+    """Open a file for one sequential pass, hinting the OS to read ahead aggressively"""
+    # O_SEQUENTIAL maps to FILE_FLAG_SEQUENTIAL_SCAN on Windows
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0) | getattr(os, 'O_SEQUENTIAL', 0))
+    if hasattr(os, 'posix_fadvise'):
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    return fd
+
+
+def _close_sequential(fd):
+    """Close a file opened with _open_sequential without leaving it in the page cache"""
+    try:
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+
+class MappedLog:
+    """Read-only memory map of a log file with an index of line start offsets"""
+    
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self.size = os.fstat(f.fileno()).st_size
+            # mmap() refuses empty files; an empty log simply has no lines
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if self.size else None
+        self.offsets = array('Q', [0])
+    
+    def build_index(self, keep_going=lambda: True):
+        """Record the start offset of every line, returns False if cancelled"""
+        offsets = self.offsets
+        if self.mm is not None:
+            # The index pass reads the whole mapping once, front to back
+            self._advise('MADV_SEQUENTIAL')
+            find = self.mm.find
+            pos = find(b'\n')
+            while pos != -1:
+                offsets.append(pos + 1)
+                if len(offsets) % 65536 == 0 and not keep_going():
+                    return False
+                pos = find(b'\n', pos + 1)
+            # Scrolling afterwards jumps around the file
+            self._advise('MADV_NORMAL')
+        
+        # Close the last line if the file does not end with a newline
+        if offsets[-1] != self.size:
+            offsets.append(self.size)
+        return True
+    
+    def _advise(self, name):
+        """Pass a paging hint for the mapping to the OS where mmap.madvise() (Python 3.8+) supports it"""
+        advice = getattr(mmap, name, None)
+        if advice is not None and hasattr(self.mm, 'madvise'):
+            self.mm.madvise(advice)
+    
+    @property
+    def line_count(self):
+        return len(self.offsets) - 1
+    
+    def read_lines(self, first, count):
+        """Decode count lines starting at line index first"""
+        if self.mm is None:
+            return ""
+        last = min(first + count, self.line_count)
+        # Decode straight from the mapping instead of copying the window into a bytes object first
+        with memoryview(self.mm)[self.offsets[first]:self.offsets[last]] as window:
+            return str(window, 'utf-8', 'replace')
+    
+    def close(self):
+        if self.mm is not None:
+            self.mm.close()
+            self.mm = None
+
+
+class LineSplitter:
+    """Decodes chunks of UTF-8 process output and passes the complete lines of each to a callback"""
+    
+    def __init__(self, on_lines):
+        self.on_lines = on_lines
+        self.decoder = codecs.getincrementaldecoder('utf-8')('replace')
+        # Unterminated last line of the data fed so far
+        self.pending = ''
+    
+    def feed(self, data):
+        lines = (self.pending + _decode_log_bytes(self.decoder, data)).split('\n')
+        self.pending = lines.pop()
+        if lines:
+            self.on_lines([line.rstrip() for line in lines])
+    
+    def close(self):
+        """Pass on the last line if the output did not end with a newline"""
+        rest = self.pending + self.decoder.decode(b'', True)
+        self.pending = ''
+        if rest:
+            self.on_lines([rest.rstrip()])
+
+
+class PipeProtocol:
+    """asyncio read pipe protocol feeding a LineSplitter"""
+    
+    def __init__(self, splitter):
+        self.splitter = splitter
+    
+    def connection_made(self, transport):
+        pass
+    
+    def data_received(self, data):
+        self.splitter.feed(data)
+    
+    def eof_received(self):
+        pass
+    
+    def connection_lost(self, exc):
+        self.splitter.close()
+
+
+class VirtualListbox:
+    """Listbox wrapper that keeps long item lists in Python and only a window of them in Tk"""
+    
+    # Number of rows held by the Tk listbox at a time
+    WINDOW_ROWS = 200
+    
+    def __init__(self, listbox, scrollbar):
+        self.listbox = listbox
+        self.scrollbar = scrollbar
+        self.items = []
+        self.top = 0
+        self._selected = None
+        self._render_pending = False
+        listbox.configure(yscrollcommand=self._yscroll)
+        scrollbar.configure(command=self._scroll)
+        listbox.bind('<<ListboxSelect>>', self._on_select, add='+')
+    
+    def set_items(self, items):
+        """Replace the displayed items"""
+        items = list(items)
+        if items == self.items:
+            # Nothing changed, keep the rows and selection Tk already has
+            return
+        self.items = items
+        self._selected = None
+        self._render(0, 0)
+    
+    def curselection(self):
+        """Selected indices into the full item list"""
+        return tuple(self.top + i for i in self.listbox.curselection())
+    
+    def get(self, index):
+        return self.items[index]
+    
+    def _render(self, top, first_visible):
+        """Fill the listbox with the window of items starting at top"""
+        self._render_pending = False
+        top = max(0, min(top, len(self.items) - self.WINDOW_ROWS))
+        self.top = top
+        
+        self.listbox.delete(0, 'end')
+        if self.items:
+            # One Tcl call for the whole window
+            self.listbox.insert('end', *self.items[top:top + self.WINDOW_ROWS])
+        if self._selected is not None and top <= self._selected < top + self.WINDOW_ROWS:
+            self.listbox.selection_set(self._selected - top)
+        self.listbox.yview(max(0, first_visible - top))
+    
+    def _on_select(self, event=None):
+        selection = self.listbox.curselection()
+        self._selected = self.top + selection[0] if selection else None
+    
+    def _yscroll(self, first, last):
+        """Map the window's scroll position onto the full list"""
+        total = len(self.items)
+        if total <= self.WINDOW_ROWS:
+            self.scrollbar.set(first, last)
+            return
+        
+        first, last = float(first), float(last)
+        self.scrollbar.set((self.top + first * self.WINDOW_ROWS) / total,
+                           (self.top + last * self.WINDOW_ROWS) / total)
+        
+        # Slide the window once the view gets close to one of its edges
+        near_top = first < 0.1 and self.top > 0
+        near_bottom = last > 0.9 and self.top + self.WINDOW_ROWS < total
+        if (near_top or near_bottom) and not self._render_pending:
+            self._render_pending = True
+            first_visible = self.top + int(first * self.WINDOW_ROWS)
+            self.listbox.after_idle(self._render, first_visible - self.WINDOW_ROWS // 2, first_visible)
+    
+    def _scroll(self, *args):
+        """Scrollbar command, jumps straight to the requested part of the full list"""
+        total = len(self.items)
+        if args[0] == 'moveto' and total > self.WINDOW_ROWS:
+            target = int(float(args[1]) * total)
+            self._render(target - self.WINDOW_ROWS // 2, target)
+        else:
+            self.listbox.yview(*args)
+
 
 class MinecraftServerGUI:
+    # Maximum number of lines kept in the server console
+    CONSOLE_MAX_LINES = 5000
+    # Interval (ms) at which events queued by worker threads are handled
+    EVENT_DRAIN_MS = 100
+    # Size of the reads subprocess output pipes are drained with
+    PIPE_READ_SIZE = 64 * 1024
+    # Interval (ms) at which a stopping server is checked for having exited
+    STOP_POLL_MS = 250
+    # Maximum number of mod files copied at the same time
+    MOD_COPY_WORKERS = 8
+    # Size of the chunks log files are streamed into the log viewer in
+    LOG_CHUNK_SIZE = 64 * 1024
+    # Default amount of a log file shown when not loading the full file
+    LOG_TAIL_KB = 1024
+    # Poll interval (ms) for following a log when watchdog is not installed
+    LOG_FOLLOW_POLL_MS = 1000
+    # Default maximum number of lines kept in the log viewer
+    MAX_DISPLAY_LINES = 20000
+    # Number of lines rendered at a time when viewing a full log file
+    VIRTUAL_WINDOW_LINES = 200
+    # Maximum number of streamed log chunks waiting to be displayed
+    LOG_QUEUE_MAX_CHUNKS = 256
+    # Interval of the passive status refresh; state changes update the display immediately
+    MONITOR_INTERVAL_MS = 30000
+    # Delay (ms) over which resizes of the setup tab are coalesced into one scrollregion update
+    SCROLLREGION_DEBOUNCE_MS = 40
+    
+    # server.properties keys shown in the UI: key -> (variable attribute, converter)
+    PROPERTY_VARS = {
+        'motd': ('motd_var', str),
+        'difficulty': ('difficulty_var', str),
+        'pvp': ('pvp_var', _to_bool),
+        'max-players': ('max_players_var', str),
+        'view-distance': ('view_distance_var', str),
+        'level-name': ('world_name_var', str),
+        'level-seed': ('world_seed_var', str),
+        'level-type': ('world_type_var', str),
+        'white-list': ('whitelist_var', _to_bool),
+    }
+    # .env keys shown in the UI, RAM is handled separately as it also turns off auto RAM
+    ENV_VARS = {
+        'EULA': ('eula_var', _to_bool),
+    }
+    
     def __init__(self, root, server_dir=None):
+        # No-op when main() already imported it for the root window
+        _import_tkinter()
+        
         self.root = root
         self.root.title("Minecraft Server Manager")
         self.root.geometry("1000x700")
@@ -60,18 +502,116 @@ class MinecraftServerGUI:
         # Path to setup script
         self.setup_script = self.server_dir / "universalServerSetup.sh"
         
+        # Server subdirectories managed by the world, mod and log tabs
+        self.mods_dir = self.server_dir / "mods"
+        self.backups_dir = self.server_dir / "backups"
+        self.logs_dir = self.server_dir / "logs"
+        
         # Server status tracking
         self.server_process = None
         self.server_status = "stopped"
+        self._server_ready = False
+        # Set by a reaper thread once the server process has exited
+        self._exit_event = threading.Event()
+        self._exit_event.set()
+        # Pending stop or kill waiting for the server to exit, see _after_exit()
+        self._exit_poll = None
+        
+        # Widgets of the tabs that are built on first use
+        self.worlds_listbox = None
+        self.backups_listbox = None
+        self.mods_listbox = None
+        self.log_combo = None
+        
+        # Auto-scroll of the console and log viewer
+        self.auto_scroll = False
+        
+        # Pending scrollregion update of the setup tab canvas
+        self._scrollregion_after = None
+        
+        # Last text set on each status label, so unchanged labels are not reconfigured
+        self._label_texts = {}
+        # State last shown by the status label
+        self._last_state = None
+        # Python-side mirror of max_players_var (kept current by a write trace),
+        # and the idle player label built from it
+        self._max_players = 20
+        self._players_text = "Players: 0/20"
+        
+        # Lines not yet shown, bounded so a burst never inserts more than the console keeps
+        self._console_pending = deque(maxlen=self.CONSOLE_MAX_LINES)
+        self._console_flush_pending = False
+        
+        # Newest status bar message, shown at most once per idle cycle
+        self._status_message = ""
+        self._status_update_pending = False
+        
+        # (kind, payload) events from worker threads, handled on the Tk thread by _drain_events()
+        self._event_q = queue.Queue()
+        
+        # Incremented for every log load so stale loader threads stop early
+        self._log_load_token = 0
+        
+        # Worker threads for log file reads
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        # Worker threads streaming command output where the event loop cannot run subprocesses
+        self._bg = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        # Event loop running setup and mod download commands, see _async_loop()
+        self._aio_loop = None
+        
+        # Chunks streamed by loader threads, inserted by _drain_log_queue()
+        self._log_queue = deque(maxlen=self.LOG_QUEUE_MAX_CHUNKS)
+        self._log_queue_truncated = False
+        self._log_drain_scheduled = False
+        
+        # Wrap mode saved while a bulk load runs with wrapping and scrollbar updates off
+        self._log_bulk_wrap = None
+        
+        # Position in the displayed log file, used to follow it like tail -f
+        # and to only append new output when the same file is loaded again
+        self._log_follow_path = None
+        self._log_shown = None
+        self._log_offset = 0
+        self._log_inode = None
+        self._log_decoder = None
+        self._log_observer = None
+        self._log_follow_after = None
+        self._log_update_pending = False
+        
+        # Parsed config files: path -> ((mtime_ns, size), {key: value})
+        self._config_cache = {}
+        
+        # Directory listings: (path, suffix) -> (mtime_ns, [names])
+        self._dir_cache = {}
+        
+        # Log files found by the last refresh_logs(): name -> path, and the names listed in the combobox
+        self._log_index = {}
+        self._log_files = None
+        
+        # Full-file log view: only a window of the memory-mapped file is rendered
+        self._mapped_log = None
+        self._vlog_top = 0
+        self._vlog_render_pending = False
         
         # Check if this is a fresh installation or existing server
         self.is_existing_server = self.check_existing_server()
         
         # Initialize GUI components
         self.setup_ui()
+        
+        # Config file keys resolved to the variables they set, shared by both loaders
+        self._prop_dispatch = self._build_dispatch(self.PROPERTY_VARS)
+        self._env_dispatch = self._build_dispatch(self.ENV_VARS)
+        
         self.load_current_config()
         self.update_status()
         
+        # Start handling events queued by worker threads
+        self._drain_events()
+        
+        # Stop background work when the window is closed
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
         # Start status monitoring
         self.monitor_server()
         
@@ -89,17 +629,23 @@ class MinecraftServerGUI:
             ".server_jar"
         ]
         
+        if any((self.server_dir / indicator).exists() for indicator in server_indicators):
+            return True
+        
         # Check for any server jar files
-        jar_files = list(self.server_dir.glob("*.jar"))
-        server_jars = [jar for jar in jar_files if any(name in jar.name.lower() 
-                      for name in ['forge', 'fabric', 'quilt', 'neoforge', 'server'])]
+        server_names = ('forge', 'fabric', 'quilt', 'neoforge', 'server')
+        with os.scandir(self.server_dir) as entries:
+            for entry in entries:
+                name = entry.name.lower()
+                if name.endswith('.jar') and any(server_name in name for server_name in server_names):
+                    return True
         
         # Check for mods directory
-        mods_dir = self.server_dir / "mods"
-        
-        return (any((self.server_dir / indicator).exists() for indicator in server_indicators) or 
-                len(server_jars) > 0 or 
-                (mods_dir.exists() and any(mods_dir.glob("*.jar"))))
+        try:
+            with os.scandir(self.mods_dir) as entries:
+                return any(entry.name.endswith('.jar') for entry in entries)
+        except (FileNotFoundError, NotADirectoryError):
+            return False
     
     def show_welcome_message(self):
         """Show welcome message for new server setups"""
@@ -126,13 +672,27 @@ The GUI will guide you through the entire process!"""
         # Create tabs
         self.create_setup_tab()
         self.create_server_tab()
-        self.create_worlds_tab()
-        self.create_mods_tab()
-        self.create_logs_tab()
+        
+        # The remaining tabs are only built (and their directories scanned) when first selected
+        self._tab_builders = {}
+        for title, builder in (("World Management", self.create_worlds_tab),
+                               ("Mod Management", self.create_mods_tab),
+                               ("Logs & Monitoring", self.create_logs_tab)):
+            frame = ttk.Frame(self.notebook)
+            self.notebook.add(frame, text=title)
+            self._tab_builders[str(frame)] = builder
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
         
         # Status bar at bottom
         self.create_status_bar()
     
+    def _on_tab_changed(self, event=None):
+        """Build a lazily created tab the first time it is selected"""
+        tab = self.notebook.select()
+        builder = self._tab_builders.pop(tab, None)
+        if builder is not None:
+            builder(self.notebook.nametowidget(tab))
+    
     def create_setup_tab(self):
         """Server Setup & Configuration Tab"""
         setup_frame = ttk.Frame(self.notebook)
@@ -143,10 +703,8 @@ The GUI will guide you through the entire process!"""
         scrollbar = ttk.Scrollbar(setup_frame, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        self._setup_canvas = canvas
+        scrollable_frame.bind("<Configure>", self._schedule_scrollregion)
         
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
@@ -183,6 +741,7 @@ The GUI will guide you through the entire process!"""
         # Max Players
         ttk.Label(props_frame, text="Max Players:").grid(row=row, column=0, sticky='w', pady=2)
         self.max_players_var = tk.StringVar(value="20")
+        self.max_players_var.trace_add('write', self._on_max_players_changed)
         ttk.Spinbox(props_frame, from_=1, to=100, textvariable=self.max_players_var, width=10).grid(row=row, column=1, sticky='w', pady=2)
         row += 1
         
@@ -334,6 +893,16 @@ The GUI will guide you through the entire process!"""
         scrollable_frame.columnconfigure(0, weight=1)
         scrollable_frame.columnconfigure(1, weight=1)
     
+    def _schedule_scrollregion(self, event=None):
+        """Update the setup canvas scrollregion once a burst of resizes has settled"""
+        if self._scrollregion_after is not None:
+            self.root.after_cancel(self._scrollregion_after)
+        self._scrollregion_after = self.root.after(self.SCROLLREGION_DEBOUNCE_MS, self._update_scrollregion)
+    
+    def _update_scrollregion(self):
+        self._scrollregion_after = None
+        self._setup_canvas.configure(scrollregion=self._setup_canvas.bbox("all"))
+    
     def create_server_tab(self):
         """Server Control Tab"""
         server_frame = ttk.Frame(self.notebook)
@@ -383,11 +952,8 @@ The GUI will guide you through the entire process!"""
         
         ttk.Button(input_frame, text="Send", command=self.send_command).pack(side='right', padx=(5, 0))
     
-    def create_worlds_tab(self):
+    def create_worlds_tab(self, worlds_frame):
         """World Management Tab"""
-        worlds_frame = ttk.Frame(self.notebook)
-        self.notebook.add(worlds_frame, text="World Management")
-        
         # Current World Section
         current_frame = ttk.LabelFrame(worlds_frame, text="Current World", padding=10)
         current_frame.pack(fill='x', padx=10, pady=5)
@@ -409,12 +975,12 @@ The GUI will guide you through the entire process!"""
         list_frame = ttk.Frame(available_frame)
         list_frame.pack(fill='x')
         
-        self.worlds_listbox = tk.Listbox(list_frame, height=6)
-        self.worlds_listbox.pack(side='left', fill='both', expand=True)
+        worlds_listbox = tk.Listbox(list_frame, height=6)
+        worlds_listbox.pack(side='left', fill='both', expand=True)
         
-        worlds_scroll = ttk.Scrollbar(list_frame, orient='vertical', command=self.worlds_listbox.yview)
+        worlds_scroll = ttk.Scrollbar(list_frame, orient='vertical')
         worlds_scroll.pack(side='right', fill='y')
-        self.worlds_listbox.configure(yscrollcommand=worlds_scroll.set)
+        self.worlds_listbox = VirtualListbox(worlds_listbox, worlds_scroll)
         
         worlds_buttons = ttk.Frame(available_frame)
         worlds_buttons.pack(fill='x', pady=(10, 0))
@@ -430,12 +996,12 @@ The GUI will guide you through the entire process!"""
         backup_list_frame = ttk.Frame(backup_frame)
         backup_list_frame.pack(fill='both', expand=True)
         
-        self.backups_listbox = tk.Listbox(backup_list_frame)
-        self.backups_listbox.pack(side='left', fill='both', expand=True)
+        backups_listbox = tk.Listbox(backup_list_frame)
+        backups_listbox.pack(side='left', fill='both', expand=True)
         
-        backup_scroll = ttk.Scrollbar(backup_list_frame, orient='vertical', command=self.backups_listbox.yview)
+        backup_scroll = ttk.Scrollbar(backup_list_frame, orient='vertical')
         backup_scroll.pack(side='right', fill='y')
-        self.backups_listbox.configure(yscrollcommand=backup_scroll.set)
+        self.backups_listbox = VirtualListbox(backups_listbox, backup_scroll)
         
         backup_buttons = ttk.Frame(backup_frame)
         backup_buttons.pack(fill='x', pady=(10, 0))
@@ -449,11 +1015,8 @@ The GUI will guide you through the entire process!"""
         self.refresh_worlds()
         self.refresh_backups()
     
-    def create_mods_tab(self):
+    def create_mods_tab(self, mods_frame):
         """Mod Management Tab"""
-        mods_frame = ttk.Frame(self.notebook)
-        self.notebook.add(mods_frame, text="Mod Management")
-        
         # Mod List Section
         list_frame = ttk.LabelFrame(mods_frame, text="Installed Mods", padding=10)
         list_frame.pack(fill='both', expand=True, padx=10, pady=5)
@@ -462,12 +1025,12 @@ The GUI will guide you through the entire process!"""
         mod_list_frame = ttk.Frame(list_frame)
         mod_list_frame.pack(fill='both', expand=True)
         
-        self.mods_listbox = tk.Listbox(mod_list_frame)
-        self.mods_listbox.pack(side='left', fill='both', expand=True)
+        mods_listbox = tk.Listbox(mod_list_frame)
+        mods_listbox.pack(side='left', fill='both', expand=True)
         
-        mod_scroll = ttk.Scrollbar(mod_list_frame, orient='vertical', command=self.mods_listbox.yview)
+        mod_scroll = ttk.Scrollbar(mod_list_frame, orient='vertical')
         mod_scroll.pack(side='right', fill='y')
-        self.mods_listbox.configure(yscrollcommand=mod_scroll.set)
+        self.mods_listbox = VirtualListbox(mods_listbox, mod_scroll)
         
         # Mod action buttons
         mod_buttons = ttk.Frame(list_frame)
@@ -487,19 +1050,16 @@ The GUI will guide you through the entire process!"""
         # Load mod list
         self.refresh_mods()
     
-    def create_logs_tab(self):
+    def create_logs_tab(self, logs_frame):
         """Logs & Monitoring Tab"""
-        logs_frame = ttk.Frame(self.notebook)
-        self.notebook.add(logs_frame, text="Logs & Monitoring")
-        
         # Log selection
         log_select_frame = ttk.Frame(logs_frame)
         log_select_frame.pack(fill='x', padx=10, pady=5)
         
         ttk.Label(log_select_frame, text="Log File:").pack(side='left')
         self.log_file_var = tk.StringVar()
-        log_combo = ttk.Combobox(log_select_frame, textvariable=self.log_file_var, state='readonly')
-        log_combo.pack(side='left', fill='x', expand=True, padx=(5, 0))
+        self.log_combo = ttk.Combobox(log_select_frame, textvariable=self.log_file_var, state='readonly')
+        self.log_combo.pack(side='left', fill='x', expand=True, padx=(5, 0))
         
         ttk.Button(log_select_frame, text="Refresh", command=self.refresh_logs).pack(side='right', padx=(5, 0))
         ttk.Button(log_select_frame, text="Open in Editor", command=self.open_log_in_editor).pack(side='right')
@@ -510,6 +1070,9 @@ The GUI will guide you through the entire process!"""
         
         self.log_text = scrolledtext.ScrolledText(log_content_frame, state='disabled')
         self.log_text.pack(fill='both', expand=True)
+        self.log_text.tag_configure('error', foreground='red')
+        self.log_text.tag_configure('warn', foreground='dark orange')
+        self.log_text.tag_configure('timestamp', foreground='gray')
         
         # Log control buttons
         log_buttons = ttk.Frame(log_content_frame)
@@ -519,13 +1082,30 @@ The GUI will guide you through the entire process!"""
         ttk.Button(log_buttons, text="Clear Display", command=self.clear_log_display).pack(side='left', padx=5)
         ttk.Button(log_buttons, text="Auto-scroll", command=self.toggle_auto_scroll).pack(side='left', padx=5)
         
-        self.auto_scroll = False
+        # Large logs are only loaded from the end unless the full file is requested
+        self.log_full_file_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(log_buttons, text="Load full file", 
+                       variable=self.log_full_file_var).pack(side='left', padx=5)
+        
+        ttk.Label(log_buttons, text="Tail (KB):").pack(side='left', padx=(10, 0))
+        self.log_tail_kb_var = tk.IntVar(value=self.LOG_TAIL_KB)
+        ttk.Spinbox(log_buttons, from_=64, to=65536, increment=64, 
+                   textvariable=self.log_tail_kb_var, width=8).pack(side='left', padx=5)
+        
+        self.log_follow_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(log_buttons, text="Follow", variable=self.log_follow_var,
+                       command=self.toggle_log_follow).pack(side='left', padx=5)
+        
+        ttk.Label(log_buttons, text="Max lines:").pack(side='left', padx=(10, 0))
+        self.log_max_lines_var = tk.IntVar(value=self.MAX_DISPLAY_LINES)
+        ttk.Spinbox(log_buttons, from_=1000, to=1000000, increment=1000, 
+                   textvariable=self.log_max_lines_var, width=8).pack(side='left', padx=5)
         
         # Populate log files
         self.refresh_logs()
         
         # Bind log selection change
-        log_combo.bind('<<ComboboxSelected>>', lambda e: self.load_selected_log())
+        self.log_combo.bind('<<ComboboxSelected>>', lambda e: self.load_selected_log())
     
     def create_status_bar(self):
         """Create status bar at bottom of window"""
@@ -556,57 +1136,56 @@ The GUI will guide you through the entire process!"""
         except Exception as e:
             self.log_message(f"Error loading configuration: {e}")
     
+    def _read_config(self, config_file):
+        """Parse key=value lines of a config file, reusing the result while the file is unchanged"""
+        path = os.path.abspath(config_file)
+        st = os.stat(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._config_cache.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        
+        with open(path, 'r') as f:
+            settings = {m.group(1).strip(): m.group(2).strip() 
+                        for m in _CONFIG_LINE_RE.finditer(f.read())}
+        
+        self._config_cache[path] = (stamp, settings)
+        return settings
+    
+    def purge_config_cache(self):
+        """Forget parsed config files so the next load reads them from disk"""
+        self._config_cache.clear()
+    
+    def _build_dispatch(self, table):
+        """Resolve a key -> (variable attribute, converter) table to the variables themselves"""
+        return {key: (getattr(self, var_name), convert) for key, (var_name, convert) in table.items()}
+    
+    def _apply_config(self, settings, dispatch):
+        """Set the variables of all known keys in parsed config settings"""
+        for key, value in settings.items():
+            entry = dispatch.get(key)
+            if entry is not None:
+                var, convert = entry
+                var.set(convert(value))
+    
     def load_server_properties(self, props_file):
         """Load settings from server.properties file"""
         try:
-            with open(props_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if '=' in line and not line.startswith('#'):
-                        key, value = line.split('=', 1)
-                        key = key.strip()
-                        value = value.strip()
-                        
-                        # Map server.properties to our variables
-                        if key == 'motd':
-                            self.motd_var.set(value)
-                        elif key == 'difficulty':
-                            self.difficulty_var.set(value)
-                        elif key == 'pvp':
-                            self.pvp_var.set(value.lower() == 'true')
-                        elif key == 'max-players':
-                            self.max_players_var.set(value)
-                        elif key == 'view-distance':
-                            self.view_distance_var.set(value)
-                        elif key == 'level-name':
-                            self.world_name_var.set(value)
-                        elif key == 'level-seed':
-                            self.world_seed_var.set(value)
-                        elif key == 'level-type':
-                            self.world_type_var.set(value)
-                        elif key == 'white-list':
-                            self.whitelist_var.set(value.lower() == 'true')
-                            
+            self._apply_config(self._read_config(props_file), self._prop_dispatch)
         except Exception as e:
             self.log_message(f"Error reading server.properties: {e}")
     
     def load_env_config(self, env_file):
         """Load settings from .env file"""
         try:
-            with open(env_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if '=' in line and not line.startswith('#'):
-                        key, value = line.split('=', 1)
-                        key = key.strip()
-                        value = value.strip().strip('"\'')
-                        
-                        if key == 'RAM' and value:
-                            self.ram_var.set(value)
-                            self.ram_auto_var.set(False)
-                        elif key == 'EULA':
-                            self.eula_var.set(value.lower() == 'true')
-                            
+            settings = {key: value.strip('"\'') for key, value in self._read_config(env_file).items()}
+            
+            ram = settings.get('RAM')
+            if ram:
+                self.ram_var.set(ram)
+                self.ram_auto_var.set(False)
+            
+            self._apply_config(settings, self._env_dispatch)
         except Exception as e:
             self.log_message(f"Error reading .env file: {e}")
     
@@ -615,28 +1194,37 @@ The GUI will guide you through the entire process!"""
         try:
             # Save to .env file
             env_file = self.server_dir / ".env"
-            with open(env_file, 'w') as f:
-                f.write("# Minecraft Server Configuration\n")
-                f.write("# Generated by Server GUI\n\n")
+            lines = [
+                "# Minecraft Server Configuration",
+                "# Generated by Server GUI",
+                "",
                 
                 # Server properties
-                f.write(f'PROP_MOTD="{self.motd_var.get()}"\n')
-                f.write(f'PROP_DIFFICULTY="{self.difficulty_var.get()}"\n')
-                f.write(f'PROP_PVP="{str(self.pvp_var.get()).lower()}"\n')
-                f.write(f'PROP_MAX_PLAYERS="{self.max_players_var.get()}"\n')
-                f.write(f'PROP_VIEW_DISTANCE="{self.view_distance_var.get()}"\n')
-                f.write(f'PROP_LEVEL_NAME="{self.world_name_var.get()}"\n')
-                f.write(f'PROP_LEVEL_SEED="{self.world_seed_var.get()}"\n')
-                f.write(f'PROP_LEVEL_TYPE="{self.world_type_var.get()}"\n')
-                f.write(f'PROP_WHITE_LIST="{str(self.whitelist_var.get()).lower()}"\n')
-                
-                # Memory configuration
-                if not self.ram_auto_var.get() and self.ram_var.get():
-                    f.write(f'RAM="{self.ram_var.get()}"\n')
-                
-                # Other options
-                f.write(f'EULA="{str(self.eula_var.get()).lower()}"\n')
-                
+                f'PROP_MOTD="{self.motd_var.get()}"',
+                f'PROP_DIFFICULTY="{self.difficulty_var.get()}"',
+                f'PROP_PVP="{"true" if self.pvp_var.get() else "false"}"',
+                f'PROP_MAX_PLAYERS="{self._max_players}"',
+                f'PROP_VIEW_DISTANCE="{self.view_distance_var.get()}"',
+                f'PROP_LEVEL_NAME="{self.world_name_var.get()}"',
+                f'PROP_LEVEL_SEED="{self.world_seed_var.get()}"',
+                f'PROP_LEVEL_TYPE="{self.world_type_var.get()}"',
+                f'PROP_WHITE_LIST="{"true" if self.whitelist_var.get() else "false"}"',
+            ]
+            
+            # Memory configuration
+            if not self.ram_auto_var.get() and self.ram_var.get():
+                lines.append(f'RAM="{self.ram_var.get()}"')
+            
+            # Other options
+            lines.append(f'EULA="{"true" if self.eula_var.get() else "false"}"')
+            
+            # Write a temporary file and swap it in, so an interrupted save never leaves a partial .env
+            tmp_file = env_file.with_name(".env.tmp")
+            with open(tmp_file, 'w') as f:
+                f.write('\n'.join(lines) + '\n')
+            os.replace(tmp_file, env_file)
+            
+            self.purge_config_cache()
             messagebox.showinfo("Success", f"Configuration saved to {env_file}")
             
         except Exception as e:
@@ -701,7 +1289,7 @@ The GUI will guide you through the entire process!"""
             return
         
         # Build command line arguments
-        cmd = ["bash", str(self.setup_script)]
+        cmd = _script_command(self.setup_script)
         
         # Add flags based on GUI settings
         if self.eula_var.get():
@@ -728,16 +1316,19 @@ The GUI will guide you through the entire process!"""
             cmd.extend(["--ram", self.ram_var.get()])
         
         # Server properties
-        cmd.extend([f"--motd={self.motd_var.get()}"])
-        cmd.extend([f"--difficulty={self.difficulty_var.get()}"])
-        cmd.extend([f"--pvp={str(self.pvp_var.get()).lower()}"])
-        cmd.extend([f"--max-players={self.max_players_var.get()}"])
-        cmd.extend([f"--view-distance={self.view_distance_var.get()}"])
-        cmd.extend([f"--level-name={self.world_name_var.get()}"])
-        if self.world_seed_var.get():
-            cmd.extend([f"--level-seed={self.world_seed_var.get()}"])
-        cmd.extend([f"--level-type={self.world_type_var.get()}"])
-        cmd.extend([f"--white-list={str(self.whitelist_var.get()).lower()}"])
+        cmd += (
+            f"--motd={self.motd_var.get()}",
+            f"--difficulty={self.difficulty_var.get()}",
+            f"--pvp={'true' if self.pvp_var.get() else 'false'}",
+            f"--max-players={self._max_players}",
+            f"--view-distance={self.view_distance_var.get()}",
+            f"--level-name={self.world_name_var.get()}",
+            f"--level-type={self.world_type_var.get()}",
+            f"--white-list={'true' if self.whitelist_var.get() else 'false'}",
+        )
+        world_seed = self.world_seed_var.get()
+        if world_seed:
+            cmd.append(f"--level-seed={world_seed}")
         
         # Add --no-gui to prevent recursive GUI startup
         cmd.append("--no-gui")
@@ -755,43 +1346,25 @@ The GUI will guide you through the entire process!"""
         self.setup_progress.pack(fill='x', pady=(5, 0))
         self.setup_progress.start()
         
-        # Run setup in separate thread
-        def run_setup_thread():
-            try:
-                self.log_message("Starting server setup...")
-                self.log_message(f"Command: {' '.join(cmd)}")
-                
-                # Set environment variables to signal GUI mode
-                env = os.environ.copy()
-                env['GUI_LAUNCHED'] = '1'
-                env['LAUNCHED_FROM_GUI'] = '1'
-                
-                process = subprocess.Popen(
-                    cmd,
-                    cwd=str(self.server_dir),
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    universal_newlines=True,
-                    bufsize=1,
-                    env=env
-                )
-                
-                # Read output line by line
-                for line in process.stdout:
-                    self.root.after(0, lambda l=line: self.log_message(l.rstrip()))
-                
-                process.wait()
-                
-                # Update UI based on result
-                if process.returncode == 0:
-                    self.root.after(0, lambda: self.setup_completed_successfully())
-                else:
-                    self.root.after(0, lambda: self.setup_failed(process.returncode))
-                
-            except Exception as e:
-                self.root.after(0, lambda: self.setup_error(e))
+        self.log_message("Starting server setup...")
+        self.log_message(f"Command: {' '.join(cmd)}")
+        
+        # Set environment variables to signal GUI mode
+        env = os.environ.copy()
+        env['GUI_LAUNCHED'] = '1'
+        env['LAUNCHED_FROM_GUI'] = '1'
+        
+        def setup_done(future):
+            # Update UI based on result
+            error = future.exception()
+            if error is not None:
+                self.setup_error(error)
+            elif future.result() == 0:
+                self.setup_completed_successfully()
+            else:
+                self.setup_failed(future.result())
         
-        threading.Thread(target=run_setup_thread, daemon=True).start()
+        self._run_command(cmd, setup_done, env=env)
     
     def setup_completed_successfully(self):
         """Handle successful setup completion"""
@@ -871,15 +1444,9 @@ The GUI will guide you through the entire process!"""
                     elif ram_mb > 32768:
                         warnings.append("RAM allocation above 32GB may not be necessary")
         
-        # Check server directory permissions
-        try:
-            test_file = self.server_dir / ".permission_test"
-            test_file.write_text("test")
-            test_file.unlink()
-        except PermissionError:
+        # Check server directory permissions (setup itself still reports real write errors)
+        if not os.access(self.server_dir, os.W_OK):
             errors.append(f"No write permission in server directory: {self.server_dir}")
-        except Exception as e:
-            warnings.append(f"Could not verify directory permissions: {e}")
         
         # Check for existing server files if force is not enabled
         if not self.force_var.get() and self.is_existing_server:
@@ -914,6 +1481,7 @@ The GUI will guide you through the entire process!"""
     # Server Query Methods
     def query_server_status(self, host="localhost", port=25565, timeout=5):
         """Query Minecraft server status using the Server List Ping protocol"""
+        import json
         start_time = time.time()
         try:
             # Create socket connection
@@ -943,7 +1511,6 @@ The GUI will guide you through the entire process!"""
             sock.close()
             
             # Parse JSON response
-            import json
             server_status = json.loads(response_data)
             
             # Extract player information
@@ -977,7 +1544,7 @@ The GUI will guide you through the entire process!"""
             # Server is not reachable or not responding
             return {
                 'online_players': 0,
-                'max_players': int(self.max_players_var.get()),
+                'max_players': self._max_players,
                 'motd': 'Server Offline',
                 'online': False,
                 'ping': False,
@@ -1037,39 +1604,53 @@ The GUI will guide you through the entire process!"""
         try:
             props_file = self.server_dir / "server.properties"
             if props_file.exists():
-                with open(props_file, 'r') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line.startswith('server-port='):
-                            return int(line.split('=', 1)[1])
+                return int(self._read_config(props_file).get('server-port', 25565))
             return 25565  # Default Minecraft port
         except:
             return 25565
     
     # Server Control Methods
+    @property
+    def is_server_running(self):
+        """Whether the server process is alive; reads the reaper thread's flag, so no poll() syscall"""
+        return self.server_process is not None and not self._exit_event.is_set()
+    
+    def _reap_server(self, process, exit_event):
+        """Block until the server process exits, then flag it"""
+        returncode = process.wait()
+        exit_event.set()
+        self._event_q.put(('exit', returncode))
+    
     def start_server(self):
         """Start the Minecraft server"""
+        import subprocess
         start_script = self.server_dir / "start.sh"
         if not start_script.exists():
             messagebox.showerror("Error", "start.sh not found. Run setup first.")
             return
         
-        if self.server_process and self.server_process.poll() is None:
+        if self.is_server_running:
             messagebox.showwarning("Warning", "Server is already running")
             return
         
         try:
             self.server_process = subprocess.Popen(
-                ["bash", str(start_script)],
+                _script_command(start_script),
                 cwd=str(self.server_dir),
+                stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                universal_newlines=True,
-                bufsize=1
+                bufsize=self.PIPE_READ_SIZE
             )
             
+            self._exit_event = threading.Event()
+            threading.Thread(target=self._reap_server, 
+                             args=(self.server_process, self._exit_event), daemon=True).start()
+            
+            self._server_ready = False
             self.server_status = "starting"
             self.log_message("Server starting...")
+            self.update_status()
             
             # Start reading server output
             self.read_server_output()
@@ -1077,55 +1658,92 @@ The GUI will guide you through the entire process!"""
         except Exception as e:
             messagebox.showerror("Error", f"Failed to start server: {e}")
     
-    def stop_server(self):
-        """Stop the Minecraft server gracefully"""
-        if not self.server_process or self.server_process.poll() is not None:
+    def stop_server(self, then=None):
+        """Stop the Minecraft server gracefully, then call then() once it has exited"""
+        if not self.is_server_running:
             messagebox.showwarning("Warning", "Server is not running")
             return
         
+        if self._exit_poll is not None:
+            # Already stopping, wait for that instead of sending another stop
+            if then is not None:
+                self._exit_poll['callbacks'].append(then)
+            return
+        
+        process = self.server_process
         try:
             # Send stop command to server
-            self.server_process.stdin.write("stop\n")
-            self.server_process.stdin.flush()
-            
-            # Wait for graceful shutdown
-            try:
-                self.server_process.wait(timeout=30)
-            except subprocess.TimeoutExpired:
-                self.server_process.terminate()
-                self.server_process.wait(timeout=10)
-            
-            self.server_status = "stopped"
-            self.log_message("Server stopped.")
-            
+            process.stdin.write(b"stop\n")
+            process.stdin.flush()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to stop server: {e}")
+            return
+        
+        # Wait for graceful shutdown, terminating and finally killing the server if it hangs
+        self.log_message("Stopping server...")
+        self._after_exit([(30, process.terminate), (40, process.kill)],
+                         "Server stopped.", "Failed to stop server", then)
     
     def restart_server(self):
-        """Restart the Minecraft server"""
-        self.stop_server()
-        time.sleep(2)
-        self.start_server()
+        """Restart the Minecraft server, or just start it if it is not running"""
+        self._when_stopped(lambda: self.root.after(2000, self.start_server))
     
     def kill_server(self):
         """Force kill the server process"""
-        if not self.server_process or self.server_process.poll() is not None:
+        if not self.is_server_running:
             messagebox.showwarning("Warning", "Server is not running")
             return
         
-        try:
-            self.server_process.terminate()
-            try:
-                self.server_process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                self.server_process.kill()
-                self.server_process.wait()
-            
+        process = self.server_process
+        self._after_exit([(0, process.terminate), (5, process.kill)],
+                         "Server force killed.", "Failed to kill server")
+    
+    def _after_exit(self, steps, done_message, error_prefix, then=None):
+        """Poll from the Tk loop until the server has exited, then call then();
+        steps are (seconds, action) pairs run in order while it is still alive after that long.
+        If a poll is already pending, its steps and messages are replaced and then() joins it"""
+        pending = self._exit_poll
+        start_polling = pending is None
+        if start_polling:
+            pending = self._exit_poll = {'callbacks': []}
+        pending.update(steps=deque(steps), start=time.monotonic(),
+                       done_message=done_message, error_prefix=error_prefix)
+        if then is not None:
+            pending['callbacks'].append(then)
+        
+        if start_polling:
+            self._poll_exit(self._exit_event)
+    
+    def _poll_exit(self, exit_event):
+        """One check of the pending _after_exit() poll"""
+        pending = self._exit_poll
+        # Set by the reaper thread, so polling costs no syscall
+        if exit_event.is_set():
+            self._exit_poll = None
             self.server_status = "stopped"
-            self.log_message("Server force killed.")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to kill server: {e}")
+            self.log_message(pending['done_message'])
+            self.update_status()
+            for then in pending['callbacks']:
+                then()
+            return
+        
+        steps = pending['steps']
+        elapsed = time.monotonic() - pending['start']
+        while steps and elapsed >= steps[0][0]:
+            try:
+                steps.popleft()[1]()
+            except OSError as e:
+                self._exit_poll = None
+                messagebox.showerror("Error", f"{pending['error_prefix']}: {e}")
+                return
+        self.root.after(self.STOP_POLL_MS, self._poll_exit, exit_event)
+    
+    def _when_stopped(self, then):
+        """Call then() once the server is not running, stopping it first if needed"""
+        if self.is_server_running:
+            self.stop_server(then=then)
+        else:
+            then()
     
     def send_command(self, event=None):
         """Send command to server console"""
@@ -1133,12 +1751,12 @@ The GUI will guide you through the entire process!"""
         if not command:
             return
         
-        if not self.server_process or self.server_process.poll() is not None:
+        if not self.is_server_running:
             messagebox.showwarning("Warning", "Server is not running")
             return
         
         try:
-            self.server_process.stdin.write(f"{command}\n")
+            self.server_process.stdin.write(f"{command}\n".encode('utf-8'))
             self.server_process.stdin.flush()
             self.command_var.set("")
             self.log_console_message(f"> {command}")
@@ -1146,47 +1764,184 @@ The GUI will guide you through the entire process!"""
         except Exception as e:
             messagebox.showerror("Error", f"Failed to send command: {e}")
     
+    def _async_loop(self):
+        """Event loop thread streaming command output, started on first use"""
+        if self._aio_loop is None:
+            import asyncio
+            self._aio_loop = asyncio.new_event_loop()
+            threading.Thread(target=self._aio_loop.run_forever, daemon=True).start()
+        return self._aio_loop
+    
+    def _run_command(self, cmd, on_done, env=None):
+        """Run cmd in the server directory, queueing its output as log events,
+        then call on_done(future) with its exit code on the Tk thread"""
+        if sys.version_info >= (3, 8):
+            import asyncio
+            future = asyncio.run_coroutine_threadsafe(
+                self._stream_command(cmd, env), self._async_loop())
+        else:
+            # Before 3.8 child watchers only work with an event loop in the main thread
+            future = self._bg.submit(self._stream_command_blocking, cmd, env)
+        future.add_done_callback(lambda f: self._event_q.put(('command_done', (f, on_done))))
+    
+    async def _stream_command(self, cmd, env):
+        """Run cmd on the event loop and queue each output line"""
+        import asyncio
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=str(self.server_dir),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            env=env
+        )
+        splitter = LineSplitter(self._queue_log_lines)
+        while True:
+            data = await process.stdout.read(self.PIPE_READ_SIZE)
+            if not data:
+                break
+            splitter.feed(data)
+        splitter.close()
+        return await process.wait()
+    
+    def _stream_command_blocking(self, cmd, env):
+        """Run cmd on a worker thread and queue each output line"""
+        import subprocess
+        process = subprocess.Popen(
+            cmd,
+            cwd=str(self.server_dir),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=self.PIPE_READ_SIZE,
+            env=env
+        )
+        self._stream_pipe(process.stdout, LineSplitter(self._queue_log_lines))
+        return process.wait()
+    
+    def _queue_log_lines(self, lines):
+        """Queue command output lines for the status bar"""
+        for line in lines:
+            self._event_q.put(('log', line))
+    
     def read_server_output(self):
-        """Read server output in separate thread"""
-        def read_output():
-            try:
-                for line in self.server_process.stdout:
-                    self.root.after(0, lambda l=line: self.log_console_message(l.rstrip()))
-                    
-                    # Check for server ready message
-                    if "Done (" in line and "For help, type" in line:
-                        self.root.after(0, lambda: setattr(self, 'server_status', 'running'))
-                
-                # Server process ended
-                self.root.after(0, lambda: setattr(self, 'server_status', 'stopped'))
-                
-            except Exception as e:
-                self.root.after(0, lambda: self.log_message(f"Error reading server output: {e}"))
+        """Read server output on the event loop thread, or a separate thread where pipes cannot be polled"""
+        process = self.server_process
+        
+        def handle_lines(lines):
+            for line in lines:
+                self._event_q.put(('console', line))
+            
+            # One regex scan over everything read at once instead of one per line
+            text = '\n'.join(lines)
+            
+            # Check for server ready message (only until it has been seen)
+            if not self._server_ready and _READY_RE.search(text):
+                self._server_ready = True
+                self._event_q.put(('ready', process))
+            
+            for m in _PLAYER_EVENT_RE.finditer(text):
+                self._event_q.put(('players', m.groupdict()))
         
-        threading.Thread(target=read_output, daemon=True).start()
+        splitter = LineSplitter(handle_lines)
+        
+        def reader_failed(error):
+            self._event_q.put(('log', f"Error reading server output: {error}"))
+        
+        if os.name == 'posix':
+            # Polled by the loop that also streams setup and mod download output, no thread per server
+            loop = self._async_loop()
+            import asyncio
+            future = asyncio.run_coroutine_threadsafe(
+                loop.connect_read_pipe(lambda: PipeProtocol(splitter), process.stdout), loop)
+            
+            def on_reader_done(f):
+                # exception() raises CancelledError instead, e.g. when the loop is stopped on close
+                if f.cancelled():
+                    return
+                error = f.exception()
+                if error is not None:
+                    reader_failed(error)
+            
+            future.add_done_callback(on_reader_done)
+        else:
+            # select() only works with sockets on Windows
+            def read_output():
+                try:
+                    self._stream_pipe(process.stdout, splitter)
+                except Exception as e:
+                    reader_failed(e)
+            
+            threading.Thread(target=read_output, daemon=True).start()
+    
+    def _stream_pipe(self, pipe, splitter):
+        """Read a binary pipe in large chunks until EOF, feeding them to a LineSplitter"""
+        try:
+            while True:
+                # Whatever the pipe has buffered, up to PIPE_READ_SIZE, in one read
+                data = pipe.read1(self.PIPE_READ_SIZE)
+                if not data:
+                    break
+                splitter.feed(data)
+            splitter.close()
+        finally:
+            pipe.close()
     
     def log_console_message(self, message):
         """Log message to console display"""
+        self._console_pending.append(message)
+        if not self._console_flush_pending:
+            self._console_flush_pending = True
+            self.root.after_idle(self._flush_console)
+    
+    def _flush_console(self):
+        """Append pending console lines in one insert and trim the oldest ones"""
+        self._console_flush_pending = False
+        text = ''.join(line + '\n' for line in self._console_pending)
+        self._console_pending.clear()
+        
         self.console_text.config(state='normal')
-        self.console_text.insert('end', f"{message}\n")
+        self.console_text.insert('end', text)
+        end_line = int(self.console_text.index('end-1c').split('.')[0])
+        if end_line > self.CONSOLE_MAX_LINES:
+            self.console_text.delete('1.0', f'{end_line - self.CONSOLE_MAX_LINES}.0')
         if self.auto_scroll:
             self.console_text.see('end')
         self.console_text.config(state='disabled')
     
+    def _list_files(self, path, suffix):
+        """Names of the files in a directory ending in suffix, cached until the directory's mtime changes"""
+        key = (str(path), suffix)
+        try:
+            stamp = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            return []
+        
+        cached = self._dir_cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        
+        with os.scandir(path) as entries:
+            names = [entry.name for entry in entries if entry.name.endswith(suffix) and entry.is_file()]
+        self._dir_cache[key] = (stamp, names)
+        return names
+    
     # World Management Methods
     def refresh_worlds(self):
         """Refresh the list of available worlds"""
-        self.worlds_listbox.delete(0, 'end')
+        if self.worlds_listbox is None:
+            # Tab not built yet, it is populated when first opened
+            return
         
         try:
-            # Look for world directories
-            for item in self.server_dir.iterdir():
-                if item.is_dir() and (item / "level.dat").exists():
-                    self.worlds_listbox.insert('end', item.name)
+            # Look for world directories; not cached, since level.dat can be written after its
+            # directory without changing the server directory's mtime
+            with os.scandir(self.server_dir) as entries:
+                worlds = [entry.name for entry in entries 
+                          if entry.is_dir() and os.path.exists(os.path.join(entry.path, "level.dat"))]
+            self.worlds_listbox.set_items(worlds)
                     
             # Update current world label
             current_world = self.world_name_var.get()
-            self.current_world_label.config(text=f"Current World: {current_world}")
+            self._set_label_text(self.current_world_label, f"Current World: {current_world}")
             
         except Exception as e:
             self.log_message(f"Error refreshing worlds: {e}")
@@ -1201,15 +1956,15 @@ The GUI will guide you through the entire process!"""
         world_name = self.worlds_listbox.get(selection[0])
         
         if messagebox.askyesno("Switch World", f"Switch to world '{world_name}'?\nThis will stop the server if running."):
-            # Stop server if running
-            if self.server_process and self.server_process.poll() is None:
-                self.stop_server()
-            
-            # Update configuration
-            self.world_name_var.set(world_name)
-            self.save_config()
+            def switch():
+                # Update configuration
+                self.world_name_var.set(world_name)
+                self.save_config()
+                
+                messagebox.showinfo("Success", f"Switched to world '{world_name}'. Restart server to apply changes.")
             
-            messagebox.showinfo("Success", f"Switched to world '{world_name}'. Restart server to apply changes.")
+            # Stop server if running
+            self._when_stopped(switch)
     
     def backup_world(self):
         """Create a backup of current world"""
@@ -1222,11 +1977,11 @@ The GUI will guide you through the entire process!"""
         
         try:
             # Create backups directory
-            backup_dir = self.server_dir / "backups"
+            backup_dir = self.backups_dir
             backup_dir.mkdir(exist_ok=True)
             
             # Generate backup filename
-            timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+            timestamp = time.strftime("%Y%m%d-%H%M%S")
             backup_name = f"{world_name}-{timestamp}.zip"
             backup_path = backup_dir / backup_name
             
@@ -1234,14 +1989,17 @@ The GUI will guide you through the entire process!"""
             self.log_message(f"Creating backup: {backup_name}")
             
             def create_backup():
-                shutil.make_archive(
-                    str(backup_path.with_suffix('')),
-                    'zip',
-                    str(world_path.parent),
-                    world_name
-                )
-                self.root.after(0, lambda: messagebox.showinfo("Success", f"Backup created: {backup_name}"))
-                self.root.after(0, self.refresh_backups)
+                # Written under a temporary name so a failed backup never shows up as a .zip
+                tmp_path = backup_dir / f"{backup_name}.tmp"
+                try:
+                    _zip_tree(tmp_path, str(world_path.parent), world_name)
+                    os.replace(tmp_path, backup_path)
+                    self._event_q.put(('info', ("Success", f"Backup created: {backup_name}")))
+                    self._event_q.put(('refresh', 'backups'))
+                except Exception as e:
+                    if tmp_path.exists():
+                        tmp_path.unlink()
+                    self._event_q.put(('error', ("Error", f"Failed to create backup: {e}")))
             
             threading.Thread(target=create_backup, daemon=True).start()
             
@@ -1259,28 +2017,27 @@ The GUI will guide you through the entire process!"""
         
         if messagebox.askyesno("Delete World", 
                              f"Are you sure you want to delete world '{world_name}'?\nThis action cannot be undone!\n\nConsider creating a backup first."):
-            try:
-                # Stop server if running
-                if self.server_process and self.server_process.poll() is None:
-                    self.stop_server()
-                
-                shutil.rmtree(world_path)
-                messagebox.showinfo("Success", f"World '{world_name}' deleted")
-                self.refresh_worlds()
-                
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to delete world: {e}")
+            def delete():
+                try:
+                    shutil.rmtree(world_path)
+                    messagebox.showinfo("Success", f"World '{world_name}' deleted")
+                    self.refresh_worlds()
+                    
+                except Exception as e:
+                    messagebox.showerror("Error", f"Failed to delete world: {e}")
+            
+            # Stop server if running
+            self._when_stopped(delete)
     
     def refresh_backups(self):
         """Refresh the list of available backups"""
-        self.backups_listbox.delete(0, 'end')
+        if self.backups_listbox is None:
+            # Tab not built yet, it is populated when first opened
+            return
         
         try:
-            backup_dir = self.server_dir / "backups"
-            if backup_dir.exists():
-                backups = sorted(backup_dir.glob("*.zip"), reverse=True)
-                for backup in backups:
-                    self.backups_listbox.insert('end', backup.name)
+            backups = sorted(self._list_files(self.backups_dir, '.zip'), reverse=True)
+            self.backups_listbox.set_items(backups)
                     
         except Exception as e:
             self.log_message(f"Error refreshing backups: {e}")
@@ -1293,31 +2050,67 @@ The GUI will guide you through the entire process!"""
             return
         
         backup_name = self.backups_listbox.get(selection[0])
-        backup_path = self.server_dir / "backups" / backup_name
+        backup_path = self.backups_dir / backup_name
         
-        # Extract world name from backup filename
-        world_name = backup_name.split('-')[0]
+        # Extract world name from backup filename; world names may contain dashes themselves
+        m = _BACKUP_NAME_RE.match(backup_name)
+        world_name = m.group('world') if m else os.path.splitext(backup_name)[0]
         
         if messagebox.askyesno("Restore Backup", 
                              f"Restore backup '{backup_name}'?\nThis will overwrite the current '{world_name}' world!"):
-            try:
-                # Stop server if running
-                if self.server_process and self.server_process.poll() is None:
-                    self.stop_server()
-                
-                # Remove existing world
-                world_path = self.server_dir / world_name
-                if world_path.exists():
-                    shutil.rmtree(world_path)
-                
-                # Extract backup
-                shutil.unpack_archive(str(backup_path), str(self.server_dir))
-                
-                messagebox.showinfo("Success", f"Backup '{backup_name}' restored")
-                self.refresh_worlds()
-                
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to restore backup: {e}")
+            world_path = self.server_dir / world_name
+            
+            def extract_backup():
+                # Extract next to the live world so the final swap is a same-filesystem rename
+                tmp_dir = self.server_dir / f".restore-{os.getpid()}"
+                old_path = tmp_dir / f"{world_name}.old"
+                try:
+                    if tmp_dir.exists():
+                        shutil.rmtree(tmp_dir)
+                    tmp_dir.mkdir()
+                    
+                    last_percent = [-1]
+                    
+                    def progress(done, total):
+                        # One status update per percent, not per file
+                        percent = done * 100 // total
+                        if percent != last_percent[0]:
+                            last_percent[0] = percent
+                            self._event_q.put(('log', f"Restoring backup: {backup_name} ({percent}%)"))
+                    
+                    _extract_zip(backup_path, tmp_dir, progress)
+                    
+                    restored_path = tmp_dir / world_name
+                    if not restored_path.is_dir():
+                        raise FileNotFoundError(f"World '{world_name}' not found in backup")
+                    
+                    # Move the old world aside first so it is only discarded once the new one is in place
+                    if world_path.exists():
+                        os.replace(world_path, old_path)
+                    try:
+                        os.replace(restored_path, world_path)
+                    except OSError:
+                        # Put the live world back before tmp_dir is cleaned up
+                        if old_path.exists():
+                            os.replace(old_path, world_path)
+                        raise
+                    
+                    self._event_q.put(('info', ("Success", f"Backup '{backup_name}' restored")))
+                    self._event_q.put(('refresh', 'worlds'))
+                    
+                except Exception as e:
+                    self._event_q.put(('error', ("Error", f"Failed to restore backup: {e}")))
+                finally:
+                    # Kept if the old world could not be moved back, so it can still be recovered by hand
+                    if world_path.exists() or not old_path.exists():
+                        shutil.rmtree(tmp_dir, ignore_errors=True)
+            
+            def start_restore():
+                self.log_message(f"Restoring backup: {backup_name}")
+                threading.Thread(target=extract_backup, daemon=True).start()
+            
+            # Stop server if running, the world is only replaced once it has exited
+            self._when_stopped(start_restore)
     
     def delete_backup(self):
         """Delete selected backup"""
@@ -1327,7 +2120,7 @@ The GUI will guide you through the entire process!"""
             return
         
         backup_name = self.backups_listbox.get(selection[0])
-        backup_path = self.server_dir / "backups" / backup_name
+        backup_path = self.backups_dir / backup_name
         
         if messagebox.askyesno("Delete Backup", f"Delete backup '{backup_name}'?"):
             try:
@@ -1348,30 +2141,38 @@ The GUI will guide you through the entire process!"""
         
         if file_path:
             try:
-                backup_dir = self.server_dir / "backups"
+                backup_dir = self.backups_dir
                 backup_dir.mkdir(exist_ok=True)
                 
                 backup_name = Path(file_path).name
                 dest_path = backup_dir / backup_name
                 
-                shutil.copy2(file_path, dest_path)
-                messagebox.showinfo("Success", f"Backup imported: {backup_name}")
-                self.refresh_backups()
+                self.log_message(f"Importing backup: {backup_name}")
                 
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to import backup: {e}")
+                return
+            
+            def copy_backup():
+                try:
+                    _fast_copy(file_path, dest_path)
+                    self._event_q.put(('info', ("Success", f"Backup imported: {backup_name}")))
+                    self._event_q.put(('refresh', 'backups'))
+                except Exception as e:
+                    self._event_q.put(('error', ("Error", f"Failed to import backup: {e}")))
+            
+            threading.Thread(target=copy_backup, daemon=True).start()
     
     # Mod Management Methods
     def refresh_mods(self):
         """Refresh the list of installed mods"""
-        self.mods_listbox.delete(0, 'end')
+        if self.mods_listbox is None:
+            # Tab not built yet, it is populated when first opened
+            return
         
         try:
-            mods_dir = self.server_dir / "mods"
-            if mods_dir.exists():
-                mods = sorted(mods_dir.glob("*.jar"))
-                for mod in mods:
-                    self.mods_listbox.insert('end', mod.name)
+            mods = sorted(self._list_files(self.mods_dir, '.jar'))
+            self.mods_listbox.set_items(mods)
                     
         except Exception as e:
             self.log_message(f"Error refreshing mods: {e}")
@@ -1386,19 +2187,68 @@ The GUI will guide you through the entire process!"""
         
         if file_paths:
             try:
-                mods_dir = self.server_dir / "mods"
+                mods_dir = self.mods_dir
                 mods_dir.mkdir(exist_ok=True)
                 
-                for file_path in file_paths:
-                    mod_name = Path(file_path).name
-                    dest_path = mods_dir / mod_name
-                    shutil.copy2(file_path, dest_path)
-                
-                messagebox.showinfo("Success", f"Added {len(file_paths)} mod(s)")
-                self.refresh_mods()
-                
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to add mods: {e}")
+                return
+            
+            def copy_mods():
+                try:
+                    # Files with the same name would all be copied to the same mods/ path
+                    by_name = {}
+                    clashes = []
+                    for file_path in self._new_mod_files(file_paths, mods_dir):
+                        name = Path(file_path).name
+                        if name in by_name:
+                            clashes.append(file_path)
+                        else:
+                            by_name[name] = file_path
+                    new_paths = list(by_name.values())
+                    
+                    if new_paths:
+                        # The copies are independent, so overlap their I/O
+                        workers = min(self.MOD_COPY_WORKERS, len(new_paths))
+                        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+                            list(pool.map(lambda file_path: _fast_copy(file_path, mods_dir / Path(file_path).name),
+                                          new_paths))
+                    
+                    message = f"Added {len(new_paths)} mod(s)"
+                    skipped = len(file_paths) - len(new_paths) - len(clashes)
+                    if skipped:
+                        message += f", skipped {skipped} already installed"
+                    if clashes:
+                        message += ("\n\nNot added, a file with the same name was already selected:\n" + 
+                                    "\n".join(clashes))
+                        self._event_q.put(('warning', ("Warning", message)))
+                    else:
+                        self._event_q.put(('info', ("Success", message)))
+                    self._event_q.put(('refresh', 'mods'))
+                except Exception as e:
+                    self._event_q.put(('error', ("Error", f"Failed to add mods: {e}")))
+            
+            threading.Thread(target=copy_mods, daemon=True).start()
+    
+    def _new_mod_files(self, file_paths, mods_dir):
+        """The files not already installed in mods_dir under any name"""
+        # Only same-size jars can be identical, so most files are never hashed
+        installed = {}
+        with os.scandir(mods_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('.jar') and entry.is_file():
+                    installed.setdefault(entry.stat().st_size, []).append(entry.path)
+        
+        digests = {}
+        
+        def digest(path):
+            if path not in digests:
+                digests[path] = _file_digest(path)
+            return digests[path]
+        
+        return [file_path for file_path in file_paths 
+                if not any(digest(path) == digest(file_path) 
+                           for path in installed.get(os.path.getsize(file_path), ()))]
     
     def remove_mod(self):
         """Remove selected mod"""
@@ -1408,7 +2258,7 @@ The GUI will guide you through the entire process!"""
             return
         
         mod_name = self.mods_listbox.get(selection[0])
-        mod_path = self.server_dir / "mods" / mod_name
+        mod_path = self.mods_dir / mod_name
         
         if messagebox.askyesno("Remove Mod", f"Remove mod '{mod_name}'?"):
             try:
@@ -1427,111 +2277,465 @@ The GUI will guide you through the entire process!"""
             return
         
         # Run the mod download using the setup script
-        cmd = ["bash", str(self.setup_script), "--auto-download-mods", "--dry-run"]
-        
-        def download_thread():
-            try:
-                self.log_message("Starting automatic mod download...")
-                
-                process = subprocess.Popen(
-                    cmd,
-                    cwd=str(self.server_dir),
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    universal_newlines=True,
-                    bufsize=1
-                )
-                
-                for line in process.stdout:
-                    self.root.after(0, lambda l=line: self.log_message(l.rstrip()))
-                
-                process.wait()
-                
-                if process.returncode == 0:
-                    self.root.after(0, lambda: messagebox.showinfo("Success", "Mod download completed"))
-                    self.root.after(0, self.refresh_mods)
-                else:
-                    self.root.after(0, lambda: messagebox.showerror("Error", "Mod download failed"))
-                
-            except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Mod download failed: {e}"))
+        cmd = _script_command(self.setup_script) + ["--auto-download-mods", "--dry-run"]
+        
+        def download_done(future):
+            error = future.exception()
+            if error is not None:
+                messagebox.showerror("Error", f"Mod download failed: {error}")
+            elif future.result() == 0:
+                messagebox.showinfo("Success", "Mod download completed")
+                self.refresh_mods()
+            else:
+                messagebox.showerror("Error", "Mod download failed")
         
-        threading.Thread(target=download_thread, daemon=True).start()
+        self.log_message("Starting automatic mod download...")
+        self._run_command(cmd, download_done)
     
     # Log Management Methods
     def refresh_logs(self):
         """Refresh the list of available log files"""
+        if self.log_combo is None:
+            # Tab not built yet, it is populated when first opened
+            return
+        
         try:
-            log_files = []
+            log_index = {}
             
-            # Server logs
-            if (self.server_dir / "logs").exists():
-                log_files.extend(str(f.relative_to(self.server_dir)) for f in (self.server_dir / "logs").glob("*.log"))
-            
-            # Installation logs
-            if (self.server_dir / "logs").exists():
-                log_files.extend(str(f.relative_to(self.server_dir)) for f in (self.server_dir / "logs").glob("install-*.log"))
+            # Server and installation logs (install-*.log included), one directory read for all of them
+            for name in self._list_files(self.logs_dir, '.log'):
+                log_index[f"logs/{name}"] = self.logs_dir / name
+            log_files = sorted(log_index)
             
             # Other relevant files
-            for file_name in ["server.properties", "eula.txt", "ops.json", "whitelist.json"]:
-                if (self.server_dir / file_name).exists():
-                    log_files.append(file_name)
-            
-            # Update combobox
-            log_combo = None
-            for child in self.notebook.nametowidget(self.notebook.tabs()[-1]).winfo_children():
-                if isinstance(child, ttk.Frame):
-                    for widget in child.winfo_children():
-                        if isinstance(widget, ttk.Combobox):
-                            log_combo = widget
-                            break
-                    if log_combo:
-                        break
+            other_files = ["server.properties", "eula.txt", "ops.json", "whitelist.json"]
+            with os.scandir(self.server_dir) as entries:
+                for entry in entries:
+                    if entry.name in other_files and entry.is_file():
+                        log_index[entry.name] = Path(entry.path)
+            log_files.extend(name for name in other_files if name in log_index)
+            
+            self._log_index = log_index
             
-            if log_combo:
-                log_combo['values'] = log_files
-                if log_files and not self.log_file_var.get():
-                    self.log_file_var.set(log_files[0])
+            # Update combobox, unless it already lists the same files
+            if log_files != self._log_files:
+                self.log_combo['values'] = log_files
+                self._log_files = log_files
+            if log_files and not self.log_file_var.get():
+                self.log_file_var.set(log_files[0])
             
         except Exception as e:
             self.log_message(f"Error refreshing logs: {e}")
     
+    def _find_log(self, log_file):
+        """Return the path of a log file, or None if it does not exist"""
+        log_path = self._log_index.get(log_file)
+        if log_path is not None:
+            # Listed by the last refresh; a file removed since then fails when it is opened
+            return log_path
+        
+        log_path = self.server_dir / log_file
+        return log_path if log_path.exists() else None
+    
     def load_selected_log(self):
         """Load the selected log file"""
         log_file = self.log_file_var.get()
         if not log_file:
             return
         
-        log_path = self.server_dir / log_file
+        log_path = self._find_log(log_file)
+        
+        try:
+            tail_bytes = max(1, self.log_tail_kb_var.get()) * 1024
+        except (tk.TclError, ValueError):
+            tail_bytes = self.LOG_TAIL_KB * 1024
+        
+        # Reloading the tail already on display only needs what was written since
+        shown = (log_path, tail_bytes, self._log_max_lines())
+        if log_path is not None and shown == self._log_shown and not self.log_full_file_var.get():
+            self._read_log_updates()
+            return
+        
+        # Supersede any load that is still streaming a previous selection
+        self._log_load_token += 1
+        token = self._log_load_token
+        self._stop_log_follow()
+        self._log_follow_path = None
+        self._log_shown = None
+        self._end_bulk_log_load()
+        self._close_mapped_log()
         
-        if not log_path.exists():
-            self.log_text.config(state='normal')
+        with self._editable_log():
             self.log_text.delete(1.0, 'end')
-            self.log_text.insert('end', f"Log file not found: {log_path}")
-            self.log_text.config(state='disabled')
+            if log_path is None:
+                self.log_text.insert('end', f"Log file not found: {self.server_dir / log_file}")
+                return
+        
+        if self.log_full_file_var.get():
+            self._load_mapped_log(log_path, token)
             return
         
+        self._begin_bulk_log_load()
+        
+        def read_log():
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+            fd = _open_sequential(log_path)
+            try:
+                st = os.fstat(fd)
+                skip_partial_line = st.st_size > tail_bytes
+                if skip_partial_line:
+                    os.lseek(fd, st.st_size - tail_bytes, os.SEEK_SET)
+                    notice = (f"[Showing the last {tail_bytes // 1024} KB of {st.st_size // 1024} KB - "
+                              f"enable 'Load full file' to see everything]\n")
+                    self._queue_log_chunk(token, notice)
+                
+                while token == self._log_load_token:
+                    data = os.read(fd, self.LOG_CHUNK_SIZE)
+                    if not data:
+                        break
+                    if skip_partial_line:
+                        # Start at the first complete line inside the tail window
+                        newline = data.find(b'\n')
+                        if newline == -1:
+                            continue
+                        data = data[newline + 1:]
+                        skip_partial_line = False
+                    chunk = _decode_log_bytes(decoder, data)
+                    if chunk:
+                        self._queue_log_chunk(token, chunk)
+                
+                if token == self._log_load_token:
+                    self._event_q.put(('log_loaded', (token, shown, os.lseek(fd, 0, os.SEEK_CUR), 
+                                                      st.st_ino, decoder)))
+            finally:
+                _close_sequential(fd)
+        
+        future = self._io_pool.submit(read_log)
+        future.add_done_callback(lambda f: self._log_io_done(f, token))
+    
+    def _log_io_done(self, future, token):
+        """Report a failed log read (called on the worker thread)"""
+        if not future.cancelled() and future.exception() is not None:
+            self._queue_log_chunk(token, f"\nError loading log file: {future.exception()}")
+            self._event_q.put(('log_failed', token))
+    
+    def _begin_bulk_log_load(self):
+        """Stop re-wrapping lines and updating the scrollbar while a load streams in"""
+        if self._log_bulk_wrap is None:
+            self._log_bulk_wrap = self.log_text.cget('wrap')
+            self.log_text.config(wrap='none', yscrollcommand=lambda *args: None)
+    
+    def _end_bulk_log_load(self, token=None):
+        """Restore wrapping and scrollbar updates after a bulk load"""
+        if self._log_bulk_wrap is None or (token is not None and token != self._log_load_token):
+            return
+        
+        self.log_text.config(wrap=self._log_bulk_wrap, yscrollcommand=self.log_text.vbar.set)
+        self._log_bulk_wrap = None
+        if self.auto_scroll:
+            self.log_text.see('end')
+    
+    def _queue_log_chunk(self, token, chunk):
+        """Hand a chunk of log text from a loader thread to the Tk thread"""
+        if token != self._log_load_token:
+            # Superseded load, don't let it crowd out chunks of the current one
+            return
+        if len(self._log_queue) == self._log_queue.maxlen:
+            # Display is falling behind, the oldest pending chunk gets dropped
+            self._log_queue_truncated = True
+        self._log_queue.append((token, chunk))
+        
+        if not self._log_drain_scheduled:
+            self._log_drain_scheduled = True
+            self._event_q.put(('log_chunks', None))
+    
+    def _drain_log_queue(self):
+        """Display all pending chunks of the current log load at once"""
+        # Reset first so chunks queued while draining schedule another pass
+        self._log_drain_scheduled = False
+        
+        chunks = []
+        if self._log_queue_truncated:
+            self._log_queue_truncated = False
+            chunks.append("\n... output truncated ...\n")
         try:
-            self.log_text.config(state='normal')
-            self.log_text.delete(1.0, 'end')
+            while True:
+                token, chunk = self._log_queue.popleft()
+                if token == self._log_load_token:
+                    chunks.append(chunk)
+        except IndexError:
+            pass
+        
+        if chunks:
+            self._append_log_chunks(chunks)
+    
+    def _append_log_chunks(self, chunks):
+        """Append chunks of log text to the viewer"""
+        # One insert (and layout pass) for everything that arrived since the last drain
+        text = ''.join(chunks)
+        with self._editable_log():
+            start = self.log_text.index('end-1c')
+            self.log_text.insert('end', text)
+            self._highlight_log(start, text)
             
-            with open(log_path, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
-                self.log_text.insert('end', content)
+            # Drop the oldest lines so layout cost stays bounded
+            max_lines = self._log_max_lines()
+            end_line = int(self.log_text.index('end-1c').split('.')[0])
+            if end_line > max_lines:
+                self.log_text.delete('1.0', f'{end_line - max_lines}.0')
             
+            if self.auto_scroll:
+                self.log_text.see('end')
+    
+    def _log_max_lines(self):
+        """Maximum number of lines the log viewer keeps"""
+        try:
+            return max(1, self.log_max_lines_var.get())
+        except (tk.TclError, ValueError):
+            return self.MAX_DISPLAY_LINES
+    
+    def _highlight_log(self, start, text):
+        """Tag errors, warnings and timestamps in text inserted at index start"""
+        line, col = map(int, start.split('.'))
+        spans = {}
+        pos = 0
+        for m in _LOG_HIGHLIGHT_RE.finditer(text):
+            # Advance the line/column position incrementally instead of using "+Nc" indices
+            newlines = text.count('\n', pos, m.start())
+            if newlines:
+                line += newlines
+                col = m.start() - text.rfind('\n', pos, m.start()) - 1
+            else:
+                col += m.start() - pos
+            pos = m.start()
+            spans.setdefault(m.lastgroup, []).extend(
+                (f'{line}.{col}', f'{line}.{col + m.end() - m.start()}'))
+        
+        for tag, indices in spans.items():
+            self.log_text.tag_add(tag, *indices)
+    
+    @contextmanager
+    def _editable_log(self):
+        """Temporarily make the read-only log viewer writable"""
+        self.log_text.config(state='normal')
+        try:
+            yield
+        finally:
             self.log_text.config(state='disabled')
+    
+    def _load_mapped_log(self, log_path, token):
+        """Index the full log file in the background, then show it virtualized"""
+        def index_log():
+            mapped = MappedLog(log_path)
+            if mapped.build_index(lambda: token == self._log_load_token):
+                self._event_q.put(('log_mapped', (mapped, token)))
+            else:
+                mapped.close()
+        
+        future = self._io_pool.submit(index_log)
+        future.add_done_callback(lambda f: self._log_io_done(f, token))
+    
+    def _show_mapped_log(self, mapped, token):
+        """Switch the log viewer to rendering a window of a mapped log file"""
+        if token != self._log_load_token:
+            mapped.close()
+            return
+        
+        self._mapped_log = mapped
+        
+        # The scrollbar now represents the whole file instead of the widget contents
+        self.log_text.config(yscrollcommand=self._vlog_yscroll)
+        self.log_text.vbar.config(command=self._vlog_scrollbar)
+        
+        start = mapped.line_count - 1 if self.auto_scroll else 0
+        self._vlog_render(start - self.VIRTUAL_WINDOW_LINES // 2, start)
+    
+    def _close_mapped_log(self):
+        """Leave the virtualized view and release the memory map"""
+        if self._mapped_log is None:
+            return
+        
+        self._mapped_log.close()
+        self._mapped_log = None
+        self.log_text.config(yscrollcommand=self.log_text.vbar.set)
+        self.log_text.vbar.config(command=self.log_text.yview)
+    
+    def _vlog_render(self, top, first_visible):
+        """Render the window of lines starting at top, scrolled to first_visible"""
+        self._vlog_render_pending = False
+        mapped = self._mapped_log
+        if mapped is None:
+            return
+        
+        top = max(0, min(top, mapped.line_count - self.VIRTUAL_WINDOW_LINES))
+        self._vlog_top = top
+        
+        with self._editable_log():
+            self.log_text.delete('1.0', 'end')
+            text = mapped.read_lines(top, self.VIRTUAL_WINDOW_LINES)
+            self.log_text.insert('end', text)
+            self._highlight_log('1.0', text)
+        self.log_text.yview(f'{max(0, first_visible - top) + 1}.0')
+    
+    def _vlog_yscroll(self, first, last):
+        """Map the rendered window's scroll position onto the whole file"""
+        mapped = self._mapped_log
+        if mapped is None or not mapped.line_count:
+            self.log_text.vbar.set(first, last)
+            return
+        
+        total = mapped.line_count
+        shown = min(self.VIRTUAL_WINDOW_LINES, total)
+        first, last = float(first), float(last)
+        self.log_text.vbar.set((self._vlog_top + first * shown) / total,
+                               (self._vlog_top + last * shown) / total)
+        
+        # Slide the window once the view gets close to one of its edges
+        near_top = first < 0.1 and self._vlog_top > 0
+        near_bottom = last > 0.9 and self._vlog_top + shown < total
+        if (near_top or near_bottom) and not self._vlog_render_pending:
+            self._vlog_render_pending = True
+            first_line = self._vlog_top + int(first * shown)
+            self.root.after_idle(self._vlog_render, first_line - shown // 2, first_line)
+    
+    def _vlog_scrollbar(self, *args):
+        """Scrollbar command while a mapped log is displayed"""
+        if self._mapped_log is None:
+            self.log_text.yview(*args)
+        elif args[0] == 'moveto':
+            line = int(float(args[1]) * self._mapped_log.line_count)
+            self._vlog_render(line - self.VIRTUAL_WINDOW_LINES // 2, line)
+        else:
+            # Unit and page scrolling move within the window, which slides at its edges
+            self.log_text.yview(*args)
+    
+    def _log_load_finished(self, token, shown, offset, inode, decoder):
+        """Remember where a completed load ended so the log can be followed"""
+        if token != self._log_load_token:
+            return
+        
+        # Show everything the loader queued before any followed updates
+        self._drain_log_queue()
+        self._end_bulk_log_load()
+        
+        self._log_follow_path = shown[0]
+        self._log_shown = shown
+        self._log_offset = offset
+        self._log_inode = inode
+        self._log_decoder = decoder
+        
+        if self.log_follow_var.get():
+            self._start_log_follow()
+    
+    def toggle_log_follow(self):
+        """Start or stop following the displayed log file"""
+        if self.log_follow_var.get():
+            self._start_log_follow()
+        else:
+            self._stop_log_follow()
+    
+    def _start_log_follow(self):
+        """Watch the displayed log for changes, with watchdog if available"""
+        self._stop_log_follow()
+        if self._log_follow_path is None:
+            # Following starts once the selected log has finished loading
+            return
+        
+        try:
+            from watchdog.observers import Observer
+            from watchdog.events import FileSystemEventHandler
+        except ImportError:
+            self._log_follow_after = self.root.after(self.LOG_FOLLOW_POLL_MS, self._poll_log_follow)
+            return
+        
+        gui = self
+        followed_path = str(self._log_follow_path)
+        
+        class LogChangeHandler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.src_path == followed_path and not gui._log_update_pending:
+                    gui._log_update_pending = True
+                    gui._event_q.put(('log_changed', None))
+        
+        self._log_observer = Observer()
+        self._log_observer.schedule(LogChangeHandler(), str(self._log_follow_path.parent), recursive=False)
+        self._log_observer.start()
+    
+    def _stop_log_follow(self):
+        """Stop watching the displayed log file"""
+        if self._log_observer is not None:
+            self._log_observer.stop()
+            self._log_observer = None
+        if self._log_follow_after is not None:
+            self.root.after_cancel(self._log_follow_after)
+            self._log_follow_after = None
+    
+    def _poll_log_follow(self):
+        """Fallback follower that checks the log file periodically"""
+        self._read_log_updates()
+        self._log_follow_after = self.root.after(self.LOG_FOLLOW_POLL_MS, self._poll_log_follow)
+    
+    def _read_log_updates(self):
+        """Append bytes written to the followed log since it was last read"""
+        self._log_update_pending = False
+        log_path = self._log_follow_path
+        if log_path is None:
+            return
+        
+        try:
+            st = os.stat(log_path)
+            if st.st_ino != self._log_inode or st.st_size < self._log_offset:
+                # Log was rotated or truncated, start over from the beginning
+                self._log_offset = 0
+                self._log_inode = st.st_ino
+                self._log_decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
             
-        except Exception as e:
-            self.log_text.config(state='normal')
-            self.log_text.delete(1.0, 'end')
-            self.log_text.insert('end', f"Error loading log file: {e}")
-            self.log_text.config(state='disabled')
+            if st.st_size == self._log_offset:
+                return
+            
+            chunks = []
+            skip_partial_line = False
+            tail_bytes = self._log_shown[1] if self._log_shown is not None else self.LOG_TAIL_KB * 1024
+            if st.st_size - self._log_offset > tail_bytes:
+                # Too far behind to catch up on the Tk thread, jump to the tail window like a fresh load
+                skipped = st.st_size - tail_bytes - self._log_offset
+                chunks.append(f"\n[Skipped {skipped // 1024} KB of log output]\n")
+                self._log_offset = st.st_size - tail_bytes
+                self._log_decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+                skip_partial_line = True
+            
+            with open(log_path, 'rb') as f:
+                f.seek(self._log_offset)
+                # Stop at the size seen above, anything written meanwhile is read on the next pass
+                remaining = st.st_size - self._log_offset
+                while remaining > 0:
+                    data = f.read(min(self.LOG_CHUNK_SIZE, remaining))
+                    if not data:
+                        break
+                    remaining -= len(data)
+                    self._log_offset += len(data)
+                    if skip_partial_line:
+                        newline = data.find(b'\n')
+                        if newline == -1:
+                            continue
+                        data = data[newline + 1:]
+                        skip_partial_line = False
+                    chunks.append(_decode_log_bytes(self._log_decoder, data))
+            
+            self._append_log_chunks(chunks)
+            
+        except OSError:
+            # File is missing while being rotated, pick it up on the next change
+            pass
     
     def clear_log_display(self):
         """Clear the log display"""
-        self.log_text.config(state='normal')
-        self.log_text.delete(1.0, 'end')
-        self.log_text.config(state='disabled')
+        self._log_load_token += 1
+        self._log_shown = None
+        self._end_bulk_log_load()
+        self._close_mapped_log()
+        with self._editable_log():
+            self.log_text.delete(1.0, 'end')
     
     def toggle_auto_scroll(self):
         """Toggle auto-scroll for logs"""
@@ -1541,76 +2745,115 @@ The GUI will guide you through the entire process!"""
     
     def open_log_in_editor(self):
         """Open selected log in external editor"""
+        import subprocess
         log_file = self.log_file_var.get()
         if not log_file:
             return
         
-        log_path = self.server_dir / log_file
-        
-        if not log_path.exists():
-            messagebox.showerror("Error", f"Log file not found: {log_path}")
+        log_path = self._find_log(log_file)
+        if log_path is None:
+            messagebox.showerror("Error", f"Log file not found: {self.server_dir / log_file}")
             return
         
         try:
-            # Try to open with system default editor
+            # Try to open with system default editor (without waiting for it)
             if os.name == 'nt':  # Windows
                 os.startfile(str(log_path))
             elif os.name == 'posix':  # Linux/macOS
-                subprocess.run(['xdg-open', str(log_path)], check=True)
+                subprocess.Popen(
+                    ['xdg-open', str(log_path)],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True
+                )
             
+        except FileNotFoundError:
+            messagebox.showerror("Error", "No program found to open the log file (xdg-open is not installed)")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open log file: {e}")
     
     # Status and Monitoring
     def update_status(self):
         """Update server status display"""
-        if self.server_process and self.server_process.poll() is None:
-            if self.server_status == "running":
-                status_color = "green"
-                status_text = "Running"
-                
-                # Query server for real player count when running
-                def query_async():
-                    try:
-                        port = self.get_server_port()
-                        server_info = self.query_server_status("localhost", port, timeout=3)
-                        self.server_info.update(server_info)
-                        
-                        # Update UI in main thread
-                        self.root.after(0, self._update_player_display)
-                        
-                    except Exception as e:
-                        # If query fails, keep last known values
-                        pass
-                
-                # Run query in background to avoid blocking UI
-                threading.Thread(target=query_async, daemon=True).start()
-                
-            else:
-                status_color = "orange"
-                status_text = "Starting"
+        if not self.is_server_running:
+            state = "stopped"
+        elif self.server_status == "running":
+            state = "running"
         else:
-            status_color = "red"
-            status_text = "Stopped"
+            state = "starting"
+        
+        if state == "running":
+            # Query server for real player count when running
+            def query_async():
+                try:
+                    port = self.get_server_port()
+                    server_info = self.query_server_status("localhost", port, timeout=3)
+                    
+                    # Update UI in main thread
+                    self._event_q.put(('server_info', server_info))
+                    
+                except Exception as e:
+                    # If query fails, keep last known values
+                    pass
+            
+            # Run query in background to avoid blocking UI
+            threading.Thread(target=query_async, daemon=True).start()
+            
+        elif state == "stopped":
             self.server_status = "stopped"
             # Reset player count when server is stopped
             self.server_info.update({
                 "online_players": 0,
-                "max_players": int(self.max_players_var.get()),
+                "max_players": self._max_players,
                 "online": False
             })
         
-        self.status_label.config(text=f"Status: {status_text}")
+        if state != self._last_state:
+            color, text = _STATE_TABLE[state]
+            self.status_label.config(text=text, foreground=color)
+            self._last_state = state
         self._update_player_display()
     
+    def _apply_player_event(self, event):
+        """Update the player count from a list/join/leave line of the server log"""
+        info = self.server_info
+        players = list(info.get('player_list', []))
+        if event['online'] is not None:
+            info['online_players'] = int(event['online'])
+            info['max_players'] = int(event['max'])
+        elif event['joined'] is not None:
+            # A repeated join line must not count the player twice
+            if event['joined'] not in players:
+                players.append(event['joined'])
+                info['online_players'] = info.get('online_players', 0) + 1
+        else:
+            online = info.get('online_players', 0)
+            if event['left'] in players:
+                players.remove(event['left'])
+                info['online_players'] = max(0, online - 1)
+            elif online > len(players):
+                # A player counted by a query or `list` before their join line was seen
+                info['online_players'] = online - 1
+        info['player_list'] = players
+        self._update_player_display()
+    
+    def _on_max_players_changed(self, *args):
+        """Mirror the max players setting so status updates need no Tcl round trip"""
+        try:
+            self._max_players = int(self.max_players_var.get())
+        except ValueError:
+            # Keep the last valid value while the field is being edited
+            return
+        self._players_text = f"Players: 0/{self._max_players}"
+    
     def _update_player_display(self):
         """Update player count and server info display"""
         online = self.server_info.get('online_players', 0)
-        max_players = self.server_info.get('max_players', int(self.max_players_var.get()))
+        max_players = self.server_info.get('max_players', self._max_players)
         
         if self.server_info.get('online', False):
             # Server is online and responding to queries
-            self.players_label.config(text=f"Players: {online}/{max_players}")
+            players_text = f"Players: {online}/{max_players}"
             
             # Show ping time and additional info
             ping_time = self.server_info.get('ping_time')
@@ -1624,31 +2867,115 @@ The GUI will guide you through the entire process!"""
                         ping_text += f" | Online: {', '.join(player_list)}"
                     else:
                         ping_text += f" | Online: {', '.join(player_list[:3])} (+{len(player_list)-3} more)"
-                
-                self.ping_label.config(text=ping_text)
             else:
-                self.ping_label.config(text="")
+                ping_text = ""
                 
         else:
             # Server is offline or not responding
             if self.server_status == "running":
                 # Server process running but not responding to queries yet
-                self.players_label.config(text=f"Players: Starting... /{max_players}")
-                self.ping_label.config(text="Waiting for server to accept connections...")
+                players_text = f"Players: Starting... /{max_players}"
+                ping_text = "Waiting for server to accept connections..."
             else:
                 # Server stopped
-                self.players_label.config(text=f"Players: 0/{max_players}")
-                self.ping_label.config(text="")
+                if max_players == self._max_players:
+                    players_text = self._players_text
+                else:
+                    players_text = f"Players: 0/{max_players}"
+                ping_text = ""
+        
+        self._set_label_text(self.players_label, players_text)
+        self._set_label_text(self.ping_label, ping_text)
+    
+    def _set_label_text(self, label, text):
+        """Configure a label's text only if it differs from what is displayed"""
+        if self._label_texts.get(label) != text:
+            label.config(text=text)
+            self._label_texts[label] = text
     
     def monitor_server(self):
         """Monitor server status periodically"""
-        self.update_status()
-        self.root.after(5000, self.monitor_server)  # Check every 5 seconds
+        # State changes arrive as ready/exit events; the tick only refreshes the player count
+        if self.is_server_running:
+            self.update_status()
+        self.root.after(self.MONITOR_INTERVAL_MS, self.monitor_server)
+    
+    def _drain_events(self):
+        """Handle all events queued by worker threads"""
+        try:
+            while True:
+                self._dispatch(*self._event_q.get_nowait())
+        except queue.Empty:
+            pass
+        
+        self.root.after(self.EVENT_DRAIN_MS, self._drain_events)
+    
+    def _dispatch(self, kind, payload):
+        """Handle one event from a worker thread"""
+        if kind == 'console':
+            self.log_console_message(payload)
+        elif kind == 'log':
+            self.log_message(payload)
+        elif kind == 'ready':
+            # Ignore a late ready line from a server that has since been replaced
+            if payload is self.server_process:
+                self.server_status = "running"
+                self.update_status()
+        elif kind == 'exit':
+            # update_status() notices the process is gone and shows it as stopped
+            self.update_status()
+        elif kind == 'players':
+            self._apply_player_event(payload)
+        elif kind == 'command_done':
+            future, on_done = payload
+            on_done(future)
+        elif kind == 'server_info':
+            self.server_info.update(payload)
+            self._update_player_display()
+        elif kind == 'log_chunks':
+            self._drain_log_queue()
+        elif kind == 'log_loaded':
+            self._log_load_finished(*payload)
+        elif kind == 'log_failed':
+            self._end_bulk_log_load(payload)
+        elif kind == 'log_mapped':
+            self._show_mapped_log(*payload)
+        elif kind == 'log_changed':
+            self._read_log_updates()
+        elif kind == 'info':
+            messagebox.showinfo(*payload)
+        elif kind == 'warning':
+            messagebox.showwarning(*payload)
+        elif kind == 'error':
+            messagebox.showerror(*payload)
+        elif kind == 'refresh':
+            # payload names the list: 'worlds', 'backups' or 'mods'
+            getattr(self, f'refresh_{payload}')()
+    
+    def on_close(self):
+        """Cancel pending log reads and close the window"""
+        self._log_load_token += 1
+        self._stop_log_follow()
+        self._close_mapped_log()
+        self._io_pool.shutdown(wait=False)
+        self._bg.shutdown(wait=False)
+        if self._aio_loop is not None:
+            self._aio_loop.call_soon_threadsafe(self._aio_loop.stop)
+        self.root.destroy()
     
     def log_message(self, message):
         """Log a message to status bar"""
-        self.status_text.config(text=message)
-        print(f"[GUI] {message}")  # Also log to console for debugging
+        # Only the newest message is visible, so the label is set once per idle cycle
+        self._status_message = message
+        if not self._status_update_pending:
+            self._status_update_pending = True
+            self.root.after_idle(self._show_status_message)
+        logger.info(message)  # Also log to console for debugging
+    
+    def _show_status_message(self):
+        """Show the newest logged message in the status bar"""
+        self._status_update_pending = False
+        self.status_text.config(text=self._status_message)
 
 def main():
     """Main entry point"""
@@ -1669,7 +2996,15 @@ def main():
         print("No display available, GUI disabled")
         return
     
+    # Console log output is buffered; warnings and errors are written immediately
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter('[GUI] %(message)s'))
+    logger.addHandler(logging.handlers.MemoryHandler(
+        capacity=256, flushLevel=logging.WARNING, target=console_handler))
+    logger.setLevel(logging.INFO)
+    
     try:
+        _import_tkinter()
         root = tk.Tk()
         app = MinecraftServerGUI(root, args.server_dir)
         root.mainloop()
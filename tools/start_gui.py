@@ -83,10 +83,9 @@ def main():
             print(f"Error creating server directory: {e}")
             return 1
     
-    # Check if tkinter is available
-    try:
-        import tkinter
-    except ImportError:
+    # Check if tkinter is available, without loading Tcl/Tk before the GUI needs it
+    from importlib.util import find_spec
+    if find_spec('_tkinter') is None:
         print("Error: tkinter not available")
         print("Install tkinter with: sudo apt-get install python3-tk (or equivalent for your system)")
         return 1